@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import importlib
+import os
 import sys
 from pathlib import Path
 
@@ -80,8 +83,37 @@ class DummyGithub:
         return DummyUser()
 
 
-def find_repo_root(start: Path) -> Path:
-    p = start.resolve()
+_SET_TEMPROOT = pytest.StashKey[bool]()
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Keep tmp_path directories on tmpfs when the platform provides one.
+
+    ``$XDG_RUNTIME_DIR`` is a per-user tmpfs on systemd-based Linux, so test
+    file writes never wait on disk.  pytest still creates its numbered,
+    self-rotating ``pytest-of-<user>`` directories there, so concurrent runs
+    stay safe.  An explicit ``--basetemp`` or ``PYTEST_DEBUG_TEMPROOT`` wins.
+
+    The redirect is made through ``PYTEST_DEBUG_TEMPROOT`` in ``os.environ``,
+    so subprocesses started during the session inherit it; it is removed
+    again in ``pytest_unconfigure``.
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if config.option.basetemp or not runtime_dir or "PYTEST_DEBUG_TEMPROOT" in os.environ:
+        return
+    if os.path.isdir(runtime_dir) and os.access(runtime_dir, os.W_OK):
+        os.environ["PYTEST_DEBUG_TEMPROOT"] = runtime_dir
+        config.stash[_SET_TEMPROOT] = True
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    if config.stash.get(_SET_TEMPROOT, False):
+        os.environ.pop("PYTEST_DEBUG_TEMPROOT", None)
+
+
+@functools.cache
+def _repo_root_from(directory: Path) -> Path:
+    p = directory
     while not (p / "pyproject.toml").exists():
         if p.parent == p:
             raise RuntimeError("Repo root not found")
@@ -89,6 +121,99 @@ def find_repo_root(start: Path) -> Path:
     return p
 
 
+def find_repo_root(start: Path) -> Path:
+    """Walk upward from ``start`` to the directory holding pyproject.toml.
+
+    Results are memoized per starting directory, so repeated lookups from the
+    same place (this conftest and the agent-deck tests) walk only once.
+    """
+    p = start.resolve()
+    return _repo_root_from(p if p.is_dir() else p.parent)
+
+
+# Each gated test gets its own cache entry under this prefix, so xdist workers
+# never read-modify-write a shared value.
+CSV_PASS_CACHE_KEY = "csv/last_passed"
+# Repo files whose contents decide the outcome of the CSV integrity/sort tests,
+# including this conftest, which defines the gating and shared fixtures.
+CSV_PASS_CACHE_INPUTS = (
+    "THE_RESOURCES_TABLE.csv",
+    "templates/categories.yaml",
+    "scripts/categories/category_utils.py",
+    "scripts/resources/sort_resources.py",
+    "tests/conftest.py",
+)
+_CSV_GATED_OUTCOMES = pytest.StashKey[dict[str, str | None]]()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--no-csv-cache",
+        action="store_true",
+        default=False,
+        help="Always run the CSV data tests, even if their inputs passed unchanged before.",
+    )
+
+
+@functools.cache
+def csv_inputs_digest(test_file: Path) -> str:
+    """Hash the CSV test inputs together with the test module that checks them."""
+    root = find_repo_root(Path(__file__))
+    digest = hashlib.sha256()
+    for path in (*(root / rel for rel in CSV_PASS_CACHE_INPUTS), test_file):
+        digest.update(path.relative_to(root).as_posix().encode())
+        digest.update(b"\0")
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _is_csv_gated(item: pytest.Item) -> bool:
+    return "skip_if_csv_unchanged" in getattr(item, "fixturenames", ())
+
+
+def _csv_cache_key(nodeid: str) -> str:
+    # Node IDs contain "::" and brackets, which aren't safe in cache file names.
+    return f"{CSV_PASS_CACHE_KEY}/{hashlib.sha256(nodeid.encode()).hexdigest()[:16]}"
+
+
+@pytest.fixture
+def skip_if_csv_unchanged(request: pytest.FixtureRequest) -> None:
+    """Skip a CSV data test if it last passed against identical inputs.
+
+    Opt in with ``@pytest.mark.usefixtures("skip_if_csv_unchanged")``; pass
+    ``--no-csv-cache`` to always run.
+    """
+    cache = getattr(request.config, "cache", None)
+    if cache is None or request.config.getoption("--no-csv-cache"):
+        return
+    last_passed = cache.get(_csv_cache_key(request.node.nodeid), None)
+    if last_passed == csv_inputs_digest(request.path):
+        pytest.skip("CSV inputs unchanged since last pass")
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_makereport(item: pytest.Item, call: pytest.CallInfo[None]):
+    report = yield
+    if _is_csv_gated(item) and (report.failed or (report.when == "call" and report.passed)):
+        outcomes = item.config.stash.setdefault(_CSV_GATED_OUTCOMES, {})
+        outcomes[item.nodeid] = csv_inputs_digest(item.path) if report.passed else None
+    return report
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    """Record, per node ID, the CSV input digest each gated test just passed against.
+
+    Under xdist every worker records only the tests it ran, each under its own
+    key.  ``--no-csv-cache`` runs leave the cache untouched.
+    """
+    cache = getattr(session.config, "cache", None)
+    outcomes = session.config.stash.get(_CSV_GATED_OUTCOMES, {})
+    if cache is None or session.config.getoption("--no-csv-cache"):
+        return
+    for nodeid, digest in outcomes.items():
+        cache.set(_csv_cache_key(nodeid), digest)
+
+
 @pytest.fixture(scope="session")
 def repo_root() -> Path:
     """Resolve the repository root for tests."""
@@ -8,9 +8,17 @@ without requiring tmux or network access.
 
 from __future__ import annotations
 
+import functools
+import itertools
 import os
+import re
+import select
+import shlex
 import subprocess
 import textwrap
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
 from pathlib import Path
 
 import pytest
@@ -21,31 +29,182 @@ REPO_ROOT = find_repo_root(Path(__file__))
 AGENT_DECK = str(REPO_ROOT / "agent-deck.sh")
 
 
-def run_bash(script: str, env: dict[str, str] | None = None) -> subprocess.CompletedProcess:
-    """Run a bash snippet that sources agent-deck.sh functions and executes commands.
+@functools.cache
+def deck_script_body() -> str:
+    """Return agent-deck.sh with ``set -euo pipefail`` and the trailing ``main`` call removed.
 
-    The script sources all function definitions from agent-deck.sh without
-    calling ``main``, so tests can invoke individual functions in isolation.
+    The file is read and stripped once per test session and sourced once into
+    the long-lived ``BashShell``.
     """
-    merged_env = {**os.environ, **(env or {})}
-    # Source the script but strip the final `main "$@"` invocation so it
-    # doesn't enter the interactive loop.  We also disable set -e and stub
-    # tmux so require_tmux doesn't exit.
-    full_script = textwrap.dedent(f"""\
-        # Stub tmux so require_tmux doesn't exit
-        tmux() {{ :; }}
-        export -f tmux
-        # Source functions only: strip set -euo pipefail and the trailing main call
-        eval "$(sed -e '/^set -euo pipefail$/d' -e '/^main "\\$@"$/d' "{AGENT_DECK}")"
-        {script}
-    """)
-    return subprocess.run(
-        ["bash", "-c", full_script],
-        capture_output=True,
-        text=True,
-        env=merged_env,
-        timeout=30,
+    body = Path(AGENT_DECK).read_text(encoding="utf-8")
+    body = re.sub(r"^set -euo pipefail\n", "", body, flags=re.MULTILINE)
+    return re.sub(r'^main "\$@"\n?', "", body, flags=re.MULTILINE)
+
+
+@functools.cache
+def deck_path_assignments() -> str:
+    """Return the script's top-level ``DECK_HOME``-derived path assignments.
+
+    They are evaluated when the body is sourced, so ``BashShell.run`` replays
+    them in every snippet to pick up that snippet's HOME.
+    """
+    lines = re.findall(
+        r"^(?:DECK_HOME|SESSIONS_DIR|GLOBAL_CONFIG|ACC_CACHE)=.*$",
+        Path(AGENT_DECK).read_text(encoding="utf-8"),
+        flags=re.MULTILINE,
     )
+    return "".join(f"{line}\n" for line in lines)
+
+
+# Matches the default Linux pipe capacity, so one read drains a full pipe.
+PIPE_READ_SIZE = 65536
+
+# Shell-function stubs defined ahead of the deck body.  ``command -v`` resolves
+# functions, so require_tmux/require_git pass without the real binaries, and
+# git failures (e.g. no network) are swallowed.  The stubs are deliberately not
+# exported: only the coprocess calls them, and ``export -f`` would copy them
+# into the environment of every grep/cut/tr the deck functions fork.
+STUB_PROLOGUE = """\
+tmux() { :; }
+git() { command git "$@" 2>/dev/null || :; }
+"""
+
+
+@dataclass
+class BashResult:
+    """Captured output of a ``BashShell.run`` snippet.
+
+    Output is kept as bytes and only decoded when a test reads ``stdout`` or
+    ``stderr``; most tests never look at stderr at all.
+    """
+
+    returncode: int
+    stdout_bytes: bytes
+    stderr_bytes: bytes
+
+    @functools.cached_property
+    def stdout(self) -> str:
+        return self.stdout_bytes.decode("utf-8")
+
+    @functools.cached_property
+    def stderr(self) -> str:
+        return self.stderr_bytes.decode("utf-8")
+
+
+class BashShell:
+    """A persistent bash process with agent-deck.sh functions sourced once.
+
+    Each snippet runs in its own subshell, so variable assignments, ``cd``
+    and ``exit`` never leak into later snippets, while the deck functions are
+    inherited without re-parsing the script.  Output is framed by per-call
+    sentinels on both stdout and stderr.
+    """
+
+    def __init__(self, home: Path) -> None:
+        self._home = home
+        self._calls = itertools.count()
+        self._start()
+
+    def _start(self) -> None:
+        self._proc = subprocess.Popen(
+            ["bash"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env={**os.environ, "HOME": str(self._home)},
+        )
+        # The cached body has set -euo pipefail and the trailing `main "$@"`
+        # invocation stripped so it doesn't enter the interactive loop.
+        self._write("\n".join([STUB_PROLOGUE, deck_script_body(), ""]))
+
+    def _write(self, text: str) -> None:
+        assert self._proc.stdin is not None
+        self._proc.stdin.write(text.encode("utf-8"))
+        self._proc.stdin.flush()
+
+    def run(
+        self, script: str, env: dict[str, str] | None = None, timeout: float = 30
+    ) -> BashResult:
+        """Run a bash snippet against the sourced deck functions.
+
+        ``env`` entries are exported inside the snippet's subshell.  HOME is
+        always forwarded and the deck paths re-derived from it, so the per-test
+        ``isolated_home`` fixture applies.  If the snippet times out or kills
+        the shell, a fresh one is started before the error propagates.
+        """
+        if self._proc.poll() is not None:
+            self._restart()
+        marker = f"__DECK_END_{next(self._calls)}__"
+        # Later exports win, so an explicit HOME in ``env`` still overrides.
+        exports = f"export HOME={shlex.quote(os.environ['HOME'])}\n"
+        if env:
+            exports += "".join(f"export {key}={shlex.quote(value)}\n" for key, value in env.items())
+        exports += deck_path_assignments()
+        self._write(
+            f"(\n{exports}{textwrap.dedent(script)}\n) </dev/null\n"
+            f'echo "{marker} $?"\necho "{marker}" >&2\n'
+        )
+        try:
+            stdout, stderr = self._read_until(marker.encode(), timeout)
+        except (subprocess.TimeoutExpired, RuntimeError):
+            self._restart()
+            raise
+        out_bytes, _, status = stdout.partition(marker.encode())
+        return BashResult(int(status), out_bytes, stderr.partition(marker.encode())[0])
+
+    def _read_until(self, marker: bytes, timeout: float) -> tuple[bytes, bytes]:
+        """Read both pipes until each has emitted ``marker`` followed by a newline."""
+        assert self._proc.stdout is not None and self._proc.stderr is not None
+        buffers = {self._proc.stdout.fileno(): b"", self._proc.stderr.fileno(): b""}
+        pending = set(buffers)
+        deadline = time.monotonic() + timeout
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise subprocess.TimeoutExpired("bash", timeout)
+            ready, _, _ = select.select(list(pending), [], [], remaining)
+            for fd in ready:
+                chunk = os.read(fd, PIPE_READ_SIZE)
+                if not chunk:
+                    raise RuntimeError("bash coprocess exited unexpectedly")
+                buffers[fd] += chunk
+                _, found, tail = buffers[fd].partition(marker)
+                if found and b"\n" in tail:
+                    pending.discard(fd)
+        return buffers[self._proc.stdout.fileno()], buffers[self._proc.stderr.fileno()]
+
+    def _restart(self) -> None:
+        """Replace a hung or dead shell so one bad snippet can't break later tests."""
+        self.close()
+        self._start()
+
+    def close(self) -> None:
+        """Terminate the shell."""
+        if self._proc.stdin is not None and not self._proc.stdin.closed:
+            self._proc.stdin.close()
+        try:
+            self._proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self._proc.kill()
+            self._proc.wait()
+        for pipe in (self._proc.stdout, self._proc.stderr):
+            if pipe is not None:
+                pipe.close()
+
+
+@pytest.fixture(scope="session")
+def bash_shell(tmp_path_factory: pytest.TempPathFactory) -> Iterator[BashShell]:
+    """Start one bash coprocess per test session (per xdist worker)."""
+    shell = BashShell(tmp_path_factory.mktemp("deck-home"))
+    yield shell
+    shell.close()
+
+
+@pytest.fixture(autouse=True)
+def isolated_home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point HOME at the test's tmp_path so parallel workers never share ~/.agent-deck."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    return tmp_path
 
 
 # ---------------------------------------------------------------------------
@@ -53,6 +212,29 @@ def run_bash(script: str, env: dict[str, str] | None = None) -> subprocess.Compl
 # ---------------------------------------------------------------------------
 
 
+def check_syntax(pytestconfig: pytest.Config, script: Path) -> None:
+    """Assert ``bash -n`` accepts ``script``, skipping the fork if it passed unchanged before.
+
+    A passing result is recorded in the pytest cache keyed by the file's
+    mtime and size, so re-runs only re-check scripts that were edited.
+    """
+    stat = script.stat()
+    stamp = f"{stat.st_mtime_ns}:{stat.st_size}"
+    cache = getattr(pytestconfig, "cache", None)  # None with -p no:cacheprovider
+    cache_key = f"agent_deck/syntax/{script.name}"
+    if cache is not None and cache.get(cache_key, None) == stamp:
+        return
+    result = subprocess.run(
+        ["bash", "-n", str(script)],
+        capture_output=True,
+        text=True,
+        timeout=10,
+    )
+    assert result.returncode == 0, f"Syntax error in {script.name}:\n{result.stderr}"
+    if cache is not None:
+        cache.set(cache_key, stamp)
+
+
 class TestScriptValidity:
     """Verify the shell script is syntactically valid."""
 
@@ -62,28 +244,16 @@ class TestScriptValidity:
     def test_agent_deck_is_executable(self) -> None:
         assert os.access(AGENT_DECK, os.X_OK), "agent-deck.sh is not executable"
 
-    def test_bash_syntax_check(self) -> None:
+    def test_bash_syntax_check(self, pytestconfig: pytest.Config) -> None:
         """Verify the script passes bash syntax checking."""
-        result = subprocess.run(
-            ["bash", "-n", AGENT_DECK],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        assert result.returncode == 0, f"Syntax error in agent-deck.sh:\n{result.stderr}"
+        check_syntax(pytestconfig, Path(AGENT_DECK))
 
-    def test_install_script_syntax_check(self) -> None:
+    def test_install_script_syntax_check(self, pytestconfig: pytest.Config) -> None:
         """Verify install.sh passes bash syntax checking."""
         install_sh = REPO_ROOT / "install.sh"
         if not install_sh.exists():
             pytest.skip("install.sh not found")
-        result = subprocess.run(
-            ["bash", "-n", str(install_sh)],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        assert result.returncode == 0, f"Syntax error in install.sh:\n{result.stderr}"
+        check_syntax(pytestconfig, install_sh)
 
 
 # ---------------------------------------------------------------------------
@@ -91,75 +261,90 @@ class TestScriptValidity:
 # ---------------------------------------------------------------------------
 
 
+# Marker file (name, content) written into each case's project directory.
+DETECTION_CASES: dict[str, tuple[str, str] | None] = {
+    "python_pyproject": ("pyproject.toml", "[tool]\n"),
+    "python_requirements": ("requirements.txt", "flask\n"),
+    "python_setup_py": ("setup.py", "from setuptools import setup\n"),
+    "javascript": ("package.json", '{"name": "test"}'),
+    "rust": ("Cargo.toml", "[package]\n"),
+    "go": ("go.mod", "module test\n"),
+    "java_maven": ("pom.xml", "<project></project>\n"),
+    "java_gradle": ("build.gradle", "apply plugin: 'java'\n"),
+    "ruby": ("Gemfile", "source 'https://rubygems.org'\n"),
+    "react": ("package.json", '{"dependencies": {"react": "^18.0.0"}}'),
+    "fastapi": ("pyproject.toml", '[project]\ndependencies = ["fastapi"]\n'),
+    "empty": None,
+}
+
+
+def run_bash_batch(shell: BashShell, cases: dict[str, Path]) -> dict[str, dict[str, str]]:
+    """Run ``detect_project`` for every case directory in a single snippet.
+
+    Returns a mapping of case name to its ``LANG``/``FW``/``DOMAIN`` results.
+    """
+    script = "\n".join(
+        f'detect_project "{project_dir}"; echo "TAG={tag} LANG=$DETECTED_LANG'
+        f' FW=$DETECTED_FRAMEWORK DOMAIN=$DETECTED_DEFAULT_DOMAIN"'
+        for tag, project_dir in cases.items()
+    )
+    result = shell.run(script)
+    results: dict[str, dict[str, str]] = {}
+    for line in result.stdout.splitlines():
+        if not line.startswith("TAG="):
+            continue
+        fields = dict(field.split("=", 1) for field in line.split(" "))
+        results[fields.pop("TAG")] = fields
+    return results
+
+
+@pytest.fixture(scope="module")
+def detection_results(
+    bash_shell: BashShell, tmp_path_factory: pytest.TempPathFactory
+) -> dict[str, dict[str, str]]:
+    """Detect every case in DETECTION_CASES once and share the parsed results."""
+    base = tmp_path_factory.mktemp("detect")
+    cases: dict[str, Path] = {}
+    for tag, marker in DETECTION_CASES.items():
+        project_dir = base / tag
+        project_dir.mkdir()
+        if marker is not None:
+            name, content = marker
+            (project_dir / name).write_text(content)
+        cases[tag] = project_dir
+    return run_bash_batch(bash_shell, cases)
+
+
 class TestProjectDetection:
     """Test the detect_project function for various project types."""
 
-    def test_detect_python_pyproject(self, tmp_path: Path) -> None:
-        (tmp_path / "pyproject.toml").write_text("[tool]\n")
-        result = run_bash(f'detect_project "{tmp_path}"; echo "LANG=$DETECTED_LANG"')
-        assert "LANG=python" in result.stdout
-
-    def test_detect_python_requirements(self, tmp_path: Path) -> None:
-        (tmp_path / "requirements.txt").write_text("flask\n")
-        result = run_bash(f'detect_project "{tmp_path}"; echo "LANG=$DETECTED_LANG"')
-        assert "LANG=python" in result.stdout
-
-    def test_detect_python_setup_py(self, tmp_path: Path) -> None:
-        (tmp_path / "setup.py").write_text("from setuptools import setup\n")
-        result = run_bash(f'detect_project "{tmp_path}"; echo "LANG=$DETECTED_LANG"')
-        assert "LANG=python" in result.stdout
-
-    def test_detect_javascript(self, tmp_path: Path) -> None:
-        (tmp_path / "package.json").write_text('{"name": "test"}')
-        result = run_bash(f'detect_project "{tmp_path}"; echo "LANG=$DETECTED_LANG"')
-        assert "LANG=javascript" in result.stdout
-
-    def test_detect_rust(self, tmp_path: Path) -> None:
-        (tmp_path / "Cargo.toml").write_text("[package]\n")
-        result = run_bash(f'detect_project "{tmp_path}"; echo "LANG=$DETECTED_LANG"')
-        assert "LANG=rust" in result.stdout
-
-    def test_detect_go(self, tmp_path: Path) -> None:
-        (tmp_path / "go.mod").write_text("module test\n")
-        result = run_bash(f'detect_project "{tmp_path}"; echo "LANG=$DETECTED_LANG"')
-        assert "LANG=go" in result.stdout
-
-    def test_detect_java_maven(self, tmp_path: Path) -> None:
-        (tmp_path / "pom.xml").write_text("<project></project>\n")
-        result = run_bash(f'detect_project "{tmp_path}"; echo "LANG=$DETECTED_LANG"')
-        assert "LANG=java" in result.stdout
-
-    def test_detect_java_gradle(self, tmp_path: Path) -> None:
-        (tmp_path / "build.gradle").write_text("apply plugin: 'java'\n")
-        result = run_bash(f'detect_project "{tmp_path}"; echo "LANG=$DETECTED_LANG"')
-        assert "LANG=java" in result.stdout
-
-    def test_detect_ruby(self, tmp_path: Path) -> None:
-        (tmp_path / "Gemfile").write_text("source 'https://rubygems.org'\n")
-        result = run_bash(f'detect_project "{tmp_path}"; echo "LANG=$DETECTED_LANG"')
-        assert "LANG=ruby" in result.stdout
-
-    def test_detect_react_framework(self, tmp_path: Path) -> None:
-        (tmp_path / "package.json").write_text('{"dependencies": {"react": "^18.0.0"}}')
-        result = run_bash(
-            f'detect_project "{tmp_path}";'
-            f' echo "FW=$DETECTED_FRAMEWORK DOMAIN=$DETECTED_DEFAULT_DOMAIN"'
-        )
-        assert "FW=react" in result.stdout
-        assert "DOMAIN=4" in result.stdout
-
-    def test_detect_fastapi_framework(self, tmp_path: Path) -> None:
-        (tmp_path / "pyproject.toml").write_text('[project]\ndependencies = ["fastapi"]\n')
-        result = run_bash(
-            f'detect_project "{tmp_path}";'
-            f' echo "FW=$DETECTED_FRAMEWORK DOMAIN=$DETECTED_DEFAULT_DOMAIN"'
-        )
-        assert "FW=python-api" in result.stdout
-        assert "DOMAIN=3" in result.stdout
+    @pytest.mark.parametrize(
+        ("case", "lang"),
+        [
+            ("python_pyproject", "python"),
+            ("python_requirements", "python"),
+            ("python_setup_py", "python"),
+            ("javascript", "javascript"),
+            ("rust", "rust"),
+            ("go", "go"),
+            ("java_maven", "java"),
+            ("java_gradle", "java"),
+            ("ruby", "ruby"),
+            ("empty", ""),
+        ],
+    )
+    def test_detect_language(
+        self, detection_results: dict[str, dict[str, str]], case: str, lang: str
+    ) -> None:
+        assert detection_results[case]["LANG"] == lang
+
+    def test_detect_react_framework(self, detection_results: dict[str, dict[str, str]]) -> None:
+        assert detection_results["react"]["FW"] == "react"
+        assert detection_results["react"]["DOMAIN"] == "4"
 
-    def test_detect_empty_directory(self, tmp_path: Path) -> None:
-        result = run_bash(f'detect_project "{tmp_path}"; echo "LANG=$DETECTED_LANG"')
-        assert "LANG=" in result.stdout  # empty lang
+    def test_detect_fastapi_framework(self, detection_results: dict[str, dict[str, str]]) -> None:
+        assert detection_results["fastapi"]["FW"] == "python-api"
+        assert detection_results["fastapi"]["DOMAIN"] == "3"
 
 
 # ---------------------------------------------------------------------------
@@ -170,20 +355,20 @@ class TestProjectDetection:
 class TestSessionNameGeneration:
     """Test session_name_from_path function."""
 
-    def test_simple_directory(self) -> None:
-        result = run_bash('echo $(session_name_from_path "/home/user/myproject")')
+    def test_simple_directory(self, bash_shell: BashShell) -> None:
+        result = bash_shell.run('echo $(session_name_from_path "/home/user/myproject")')
         assert result.stdout.strip() == "deck-myproject"
 
-    def test_uppercase_converted_to_lower(self) -> None:
-        result = run_bash('echo $(session_name_from_path "/home/user/MyProject")')
+    def test_uppercase_converted_to_lower(self, bash_shell: BashShell) -> None:
+        result = bash_shell.run('echo $(session_name_from_path "/home/user/MyProject")')
         assert result.stdout.strip() == "deck-myproject"
 
-    def test_dots_converted_to_dashes(self) -> None:
-        result = run_bash('echo $(session_name_from_path "/home/user/my.project")')
+    def test_dots_converted_to_dashes(self, bash_shell: BashShell) -> None:
+        result = bash_shell.run('echo $(session_name_from_path "/home/user/my.project")')
         assert result.stdout.strip() == "deck-my-project"
 
-    def test_spaces_converted_to_dashes(self) -> None:
-        result = run_bash('echo $(session_name_from_path "/home/user/my project")')
+    def test_spaces_converted_to_dashes(self, bash_shell: BashShell) -> None:
+        result = bash_shell.run('echo $(session_name_from_path "/home/user/my project")')
         assert result.stdout.strip() == "deck-my-project"
 
 
@@ -192,45 +377,68 @@ class TestSessionNameGeneration:
 # ---------------------------------------------------------------------------
 
 
+# Every (function, argument) pair exercised by the mapping tests below.
+MAPPING_CALLS = [
+    ("commands_for_domain", "ml"),
+    ("commands_for_domain", "databricks"),
+    ("commands_for_domain", "devops"),
+    ("commands_for_domain", "unknown"),
+    ("templates_for_domain", "ml"),
+    ("templates_for_domain", "backend"),
+    ("templates_for_domain", "frontend"),
+    ("commands_for_needs", "git"),
+    ("commands_for_needs", "quality"),
+    ("commands_for_needs", "context"),
+    ("commands_for_needs", "git docs"),
+]
+
+
+@pytest.fixture(scope="module")
+def mapping_outputs(bash_shell: BashShell) -> dict[tuple[str, str], str]:
+    """Call every mapping function in MAPPING_CALLS in one snippet.
+
+    Returns the stripped output keyed by ``(function, argument)``.
+    """
+    script = "\n".join(f'echo "{func}|{arg}|$({func} "{arg}")"' for func, arg in MAPPING_CALLS)
+    result = bash_shell.run(script)
+    outputs: dict[tuple[str, str], str] = {}
+    for line in result.stdout.splitlines():
+        func, arg, output = line.split("|", 2)
+        outputs[func, arg] = output.strip()
+    return outputs
+
+
 class TestDomainMappings:
     """Test commands_for_domain and templates_for_domain functions."""
 
-    def test_ml_domain_commands(self) -> None:
-        result = run_bash('echo $(commands_for_domain "ml")')
-        output = result.stdout.strip()
+    def test_ml_domain_commands(self, mapping_outputs: dict[tuple[str, str], str]) -> None:
+        output = mapping_outputs["commands_for_domain", "ml"]
         assert "mlflow-log-model" in output
         assert "uc-register-model" in output
 
-    def test_databricks_domain_commands(self) -> None:
-        result = run_bash('echo $(commands_for_domain "databricks")')
-        output = result.stdout.strip()
-        assert "databricks-job" in output
+    def test_databricks_domain_commands(self, mapping_outputs: dict[tuple[str, str], str]) -> None:
+        assert "databricks-job" in mapping_outputs["commands_for_domain", "databricks"]
 
-    def test_devops_domain_commands(self) -> None:
-        result = run_bash('echo $(commands_for_domain "devops")')
-        output = result.stdout.strip()
+    def test_devops_domain_commands(self, mapping_outputs: dict[tuple[str, str], str]) -> None:
+        output = mapping_outputs["commands_for_domain", "devops"]
         assert "act" in output
         assert "create-hook" in output
 
-    def test_unknown_domain_returns_empty(self) -> None:
-        result = run_bash('echo ">>$(commands_for_domain "unknown")<<"')
-        assert ">><<" in result.stdout.strip()
+    def test_unknown_domain_returns_empty(
+        self, mapping_outputs: dict[tuple[str, str], str]
+    ) -> None:
+        assert mapping_outputs["commands_for_domain", "unknown"] == ""
 
-    def test_ml_domain_templates(self) -> None:
-        result = run_bash('echo $(templates_for_domain "ml")')
-        output = result.stdout.strip()
+    def test_ml_domain_templates(self, mapping_outputs: dict[tuple[str, str], str]) -> None:
+        output = mapping_outputs["templates_for_domain", "ml"]
         assert "MLflow-Databricks" in output
         assert "DSPy" in output
 
-    def test_backend_domain_templates(self) -> None:
-        result = run_bash('echo $(templates_for_domain "backend")')
-        output = result.stdout.strip()
-        assert len(output) > 0
+    def test_backend_domain_templates(self, mapping_outputs: dict[tuple[str, str], str]) -> None:
+        assert len(mapping_outputs["templates_for_domain", "backend"]) > 0
 
-    def test_frontend_domain_templates(self) -> None:
-        result = run_bash('echo $(templates_for_domain "frontend")')
-        output = result.stdout.strip()
-        assert len(output) > 0
+    def test_frontend_domain_templates(self, mapping_outputs: dict[tuple[str, str], str]) -> None:
+        assert len(mapping_outputs["templates_for_domain", "frontend"]) > 0
 
 
 # ---------------------------------------------------------------------------
@@ -241,25 +449,19 @@ class TestDomainMappings:
 class TestNeedsMappings:
     """Test commands_for_needs function."""
 
-    def test_git_needs(self) -> None:
-        result = run_bash('echo $(commands_for_needs "git")')
-        output = result.stdout.strip()
+    def test_git_needs(self, mapping_outputs: dict[tuple[str, str], str]) -> None:
+        output = mapping_outputs["commands_for_needs", "git"]
         assert "create-pr" in output
         assert "fix-github-issue" in output
 
-    def test_quality_needs(self) -> None:
-        result = run_bash('echo $(commands_for_needs "quality")')
-        output = result.stdout.strip()
-        assert "testing_plan_integration" in output
+    def test_quality_needs(self, mapping_outputs: dict[tuple[str, str], str]) -> None:
+        assert "testing_plan_integration" in mapping_outputs["commands_for_needs", "quality"]
 
-    def test_context_needs(self) -> None:
-        result = run_bash('echo $(commands_for_needs "context")')
-        output = result.stdout.strip()
-        assert "context-prime" in output
+    def test_context_needs(self, mapping_outputs: dict[tuple[str, str], str]) -> None:
+        assert "context-prime" in mapping_outputs["commands_for_needs", "context"]
 
-    def test_multiple_needs(self) -> None:
-        result = run_bash('echo $(commands_for_needs "git docs")')
-        output = result.stdout.strip()
+    def test_multiple_needs(self, mapping_outputs: dict[tuple[str, str], str]) -> None:
+        output = mapping_outputs["commands_for_needs", "git docs"]
         assert "create-pr" in output
         assert "update-docs" in output
 
@@ -269,14 +471,29 @@ class TestNeedsMappings:
 # ---------------------------------------------------------------------------
 
 
+def parse_conf(path: Path) -> dict[str, str]:
+    """Parse a session ``.conf`` file written by ``save_session``.
+
+    Values are unquoted the way ``source`` would, so ``PROJECT_DIR="/tmp/x"``
+    yields ``/tmp/x``.  Comment lines are ignored.
+    """
+    conf: dict[str, str] = {}
+    for line in path.read_text().splitlines():
+        if line.startswith("#") or "=" not in line:
+            continue
+        key, value = line.split("=", 1)
+        conf[key] = "".join(shlex.split(value))
+    return conf
+
+
 class TestSessionManagement:
     """Test session save and load operations."""
 
-    def test_save_and_load_session(self, tmp_path: Path) -> None:
+    def test_save_and_load_session(self, bash_shell: BashShell, tmp_path: Path) -> None:
         sessions_dir = tmp_path / "sessions"
         sessions_dir.mkdir()
 
-        result = run_bash(
+        result = bash_shell.run(
             f"""
             SESSIONS_DIR="{sessions_dir}"
             save_session "deck-test" "/home/user/test" "ml" \
@@ -291,11 +508,11 @@ class TestSessionManagement:
         assert "DOMAIN=ml" in result.stdout
         assert "TEAM=test" in result.stdout
 
-    def test_load_nonexistent_session_fails(self, tmp_path: Path) -> None:
+    def test_load_nonexistent_session_fails(self, bash_shell: BashShell, tmp_path: Path) -> None:
         sessions_dir = tmp_path / "sessions"
         sessions_dir.mkdir()
 
-        result = run_bash(
+        result = bash_shell.run(
             f"""
             SESSIONS_DIR="{sessions_dir}"
             load_session "deck-nonexistent" 2>&1
@@ -304,11 +521,11 @@ class TestSessionManagement:
         )
         assert "not found" in result.stdout.lower() or "EXIT=1" in result.stdout
 
-    def test_session_config_file_created(self, tmp_path: Path) -> None:
+    def test_session_config_file_created(self, bash_shell: BashShell, tmp_path: Path) -> None:
         sessions_dir = tmp_path / "sessions"
         sessions_dir.mkdir()
 
-        run_bash(
+        bash_shell.run(
             f"""
             SESSIONS_DIR="{sessions_dir}"
             save_session "deck-proj" "/tmp/proj" "backend" "git" "commit" "FastAPI"
@@ -318,9 +535,10 @@ class TestSessionManagement:
         config_file = sessions_dir / "deck-proj.conf"
         assert config_file.exists(), "Session config file not created"
 
-        content = config_file.read_text()
-        assert "PROJECT_DIR=/tmp/proj" in content
-        assert "DOMAIN=backend" in content
+        conf = parse_conf(config_file)
+        assert conf["PROJECT_DIR"] == "/tmp/proj"
+        assert conf["DOMAIN"] == "backend"
+        assert conf["TEAM_NAME"] == "proj"
 
 
 # ---------------------------------------------------------------------------
@@ -331,11 +549,11 @@ class TestSessionManagement:
 class TestListCommand:
     """Test the list/ls command."""
 
-    def test_list_with_no_sessions(self, tmp_path: Path) -> None:
+    def test_list_with_no_sessions(self, bash_shell: BashShell, tmp_path: Path) -> None:
         sessions_dir = tmp_path / "sessions"
         sessions_dir.mkdir()
 
-        result = run_bash(
+        result = bash_shell.run(
             f"""
             SESSIONS_DIR="{sessions_dir}"
             cmd_list
@@ -343,21 +561,15 @@ class TestListCommand:
         )
         assert "no sessions" in result.stdout.lower() or "No sessions" in result.stdout
 
-    def test_list_with_sessions(self, tmp_path: Path) -> None:
+    def test_list_with_sessions(self, bash_shell: BashShell, tmp_path: Path) -> None:
         sessions_dir = tmp_path / "sessions"
         sessions_dir.mkdir()
 
-        run_bash(
+        result = bash_shell.run(
             f"""
             SESSIONS_DIR="{sessions_dir}"
             save_session "deck-alpha" "/tmp/alpha" "ml" "git" "commit" "MLflow"
             save_session "deck-beta" "/tmp/beta" "backend" "git" "commit" "FastAPI"
-            """
-        )
-
-        result = run_bash(
-            f"""
-            SESSIONS_DIR="{sessions_dir}"
             cmd_list
             """
         )
@@ -370,38 +582,61 @@ class TestListCommand:
 # ---------------------------------------------------------------------------
 
 
+HELP_FLAGS = ("help", "--help", "-h")
+
+
+@pytest.fixture(scope="module")
+def help_outputs(tmp_path_factory: pytest.TempPathFactory) -> dict[str, tuple[int, str]]:
+    """Run the shipped script once per help flag, all from a single ``bash -c``.
+
+    Unlike the coprocess tests this executes agent-deck.sh as installed, with
+    ``set -euo pipefail`` and its own ``main "$@"``.  Returns each flag's exit
+    status and output.
+    """
+    result = subprocess.run(
+        [
+            "bash",
+            "-c",
+            'for flag in "${@:2}"; do echo "__HELP__ $flag"; bash "$1" "$flag"; '
+            'echo "__STATUS__ $?"; done',
+            "_",
+            AGENT_DECK,
+            *HELP_FLAGS,
+        ],
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        text=True,
+        timeout=30,
+        env={**os.environ, "HOME": str(tmp_path_factory.mktemp("help-home"))},
+    )
+    outputs: dict[str, tuple[int, str]] = {}
+    for block in result.stdout.split("__HELP__ ")[1:]:
+        flag, _, rest = block.partition("\n")
+        output, _, status = rest.rpartition("__STATUS__ ")
+        outputs[flag] = (int(status), output)
+    return outputs
+
+
 class TestHelpCommand:
     """Test the help/usage command."""
 
-    def test_help_flag(self) -> None:
-        result = subprocess.run(
-            ["bash", AGENT_DECK, "help"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        assert "agent-deck" in result.stdout.lower()
-        assert "setup" in result.stdout
-        assert "open" in result.stdout
-        assert "list" in result.stdout
-
-    def test_help_long_flag(self) -> None:
-        result = subprocess.run(
-            ["bash", AGENT_DECK, "--help"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        assert "agent-deck" in result.stdout.lower()
-
-    def test_dash_h_flag(self) -> None:
-        result = subprocess.run(
-            ["bash", AGENT_DECK, "-h"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        assert "agent-deck" in result.stdout.lower()
+    def test_help_flag(self, help_outputs: dict[str, tuple[int, str]]) -> None:
+        status, output = help_outputs["help"]
+        assert status == 0
+        assert "agent-deck" in output.lower()
+        assert "setup" in output
+        assert "open" in output
+        assert "list" in output
+
+    def test_help_long_flag(self, help_outputs: dict[str, tuple[int, str]]) -> None:
+        status, output = help_outputs["--help"]
+        assert status == 0
+        assert "agent-deck" in output.lower()
+
+    def test_dash_h_flag(self, help_outputs: dict[str, tuple[int, str]]) -> None:
+        status, output = help_outputs["-h"]
+        assert status == 0
+        assert "agent-deck" in output.lower()
 
 
 # ---------------------------------------------------------------------------
@@ -412,20 +647,28 @@ class TestHelpCommand:
 class TestInit:
     """Test the init_deck function."""
 
-    def test_init_creates_directories(self, tmp_path: Path) -> None:
+    def test_init_creates_directories(self, bash_shell: BashShell, tmp_path: Path) -> None:
         deck_home = tmp_path / "agent-deck"
-        result = run_bash(
+        result = bash_shell.run(
             f"""
             DECK_HOME="{deck_home}"
             SESSIONS_DIR="{deck_home}/sessions"
             init_deck
-            echo "SESSIONS_EXISTS=$( [ -d "{deck_home}/sessions" ] && echo yes || echo no )"
-            echo "CACHE_EXISTS=$( [ -d "{deck_home}/cache" ] && echo yes || echo no )"
+            sessions=no cache=no
+            [[ -d "{deck_home}/sessions" ]] && sessions=yes
+            [[ -d "{deck_home}/cache" ]] && cache=yes
+            echo "SESSIONS_EXISTS=$sessions"
+            echo "CACHE_EXISTS=$cache"
             """
         )
         assert "SESSIONS_EXISTS=yes" in result.stdout
         assert "CACHE_EXISTS=yes" in result.stdout
 
+    def test_deck_home_follows_test_home(self, bash_shell: BashShell, isolated_home: Path) -> None:
+        result = bash_shell.run('echo "$DECK_HOME|$SESSIONS_DIR"')
+        deck_home = isolated_home / ".agent-deck"
+        assert result.stdout.strip() == f"{deck_home}|{deck_home}/sessions"
+
 
 # ---------------------------------------------------------------------------
 # Install Resources Tests (with mock cache)
@@ -435,7 +678,7 @@ class TestInit:
 class TestInstallResources:
     """Test install_resources with a mock cache directory."""
 
-    def test_install_slash_command(self, tmp_path: Path) -> None:
+    def test_install_slash_command(self, bash_shell: BashShell, tmp_path: Path) -> None:
         # Set up a mock cache with a slash command
         cache_dir = tmp_path / "cache"
         cmd_dir = cache_dir / "resources" / "slash-commands" / "commit"
@@ -445,7 +688,7 @@ class TestInstallResources:
         target = tmp_path / "project"
         target.mkdir()
 
-        run_bash(
+        bash_shell.run(
             f"""
             ACC_CACHE="{cache_dir}"
             install_resources "{target}" "commit" ""
@@ -457,7 +700,7 @@ class TestInstallResources:
         assert installed.exists(), "Slash command was not installed"
         assert "Commit command" in installed.read_text()
 
-    def test_install_claude_md_template(self, tmp_path: Path) -> None:
+    def test_install_claude_md_template(self, bash_shell: BashShell, tmp_path: Path) -> None:
         # Set up a mock cache with a CLAUDE.md template
         cache_dir = tmp_path / "cache"
         tpl_dir = cache_dir / "resources" / "claude.md-files" / "TestTemplate"
@@ -467,7 +710,7 @@ class TestInstallResources:
         target = tmp_path / "project"
         target.mkdir()
 
-        run_bash(
+        bash_shell.run(
             f"""
             ACC_CACHE="{cache_dir}"
             install_resources "{target}" "" "TestTemplate"
@@ -481,7 +724,9 @@ class TestInstallResources:
         assert "awesome-claude-code: TestTemplate" in content
         assert "Test Template" in content
 
-    def test_install_does_not_duplicate_template(self, tmp_path: Path) -> None:
+    def test_install_does_not_duplicate_template(
+        self, bash_shell: BashShell, tmp_path: Path
+    ) -> None:
         """Installing the same template twice should not duplicate it."""
         cache_dir = tmp_path / "cache"
         tpl_dir = cache_dir / "resources" / "claude.md-files" / "DupeTest"
@@ -496,7 +741,7 @@ class TestInstallResources:
             install_resources "{target}" "" "DupeTest"
             install_resources "{target}" "" "DupeTest"
         """
-        run_bash(script, env={"HOME": str(tmp_path)})
+        bash_shell.run(script, env={"HOME": str(tmp_path)})
 
         content = (target / "CLAUDE.md").read_text()
         assert content.count("awesome-claude-code: DupeTest") == 1